@@ -1 +1 @@
-pyinstaller --onefile --windowed voronoi_diagram.py
+pyinstaller --onefile --windowed --exclude-module cupy voronoi_diagram.py
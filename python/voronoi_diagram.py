@@ -5,7 +5,7 @@ This project generates an interactive 2D Voronoi diagram with random points, usi
 The diagram supports customizable numbers of points (2–100) and colors (2–20, capped at the number of points),
 with regions colored to match their corresponding points. The interface includes toggles for point and boundary
 visibility, sliders for adjusting the number of points and colors, and a button to regenerate the diagram. Evenly
-distributes colors (black, white, and random unique colors) with randomized remainder assignment are guaranteed.
+distributes colors (black, white, and distinct golden-ratio hues) with randomized remainder assignment are guaranteed.
 
 License
 This project is licensed under the MIT License. See the `LICENSE` file for details.
@@ -14,22 +14,96 @@ Copyright (c) 2025 Vento Christian Huerlimann <box12@openspace.ch>
 
 Changelog:
 250715 v1.0.0   Initial Commit                                  Vento Christian Huerlimann <box12@openspace.ch>
+261015 v1.1.0   Numba kernel (new dependency, JIT on first run) Vento Christian Huerlimann <box12@openspace.ch>
+261015 v1.2.0   Sliders regenerate diagram (new random points)  Vento Christian Huerlimann <box12@openspace.ch>
 """
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 from matplotlib.widgets import CheckButtons, Button, Slider
-import random
+from matplotlib.collections import LineCollection
+from numba import njit, prange
+from collections import Counter
 
 # Set matplotlib backend for interactive GUI
 import matplotlib
 matplotlib.use('Qt5Agg')
 
+# Grid size for computing Voronoi diagram and maximum number of points (slider range)
+GRID_SIZE = 300  # Optimized for performance
+MAX_POINTS = 100
+
+# Number of grid rows per tile in the Voronoi kernel (a tile's buffers stay in L1 cache)
+TILE_ROWS = 32
+
+# Compute the Voronoi diagram on the GPU when the grid is large enough to benefit (requires CuPy and a CUDA device)
+GPU_MIN_GRID_SIZE = 1024
+
+# Print debug information on every regeneration
+DEBUG = False
+
+# Optional GPU support (CuPy): only imported for large grids, CPU kernel is used if no CUDA device is usable
+USE_GPU = False
+if GRID_SIZE >= GPU_MIN_GRID_SIZE:
+    try:
+        import cupy
+        USE_GPU = cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        USE_GPU = False
+
+# Persistent buffers reused across regenerations
+grid_x = np.linspace(0, 10, GRID_SIZE, dtype=np.float32)
+grid_y = grid_x
+points_buffer = np.empty((MAX_POINTS, 2), dtype=np.float32)
+h_mask = np.empty((GRID_SIZE, GRID_SIZE - 1), dtype=np.bool_)
+v_mask = np.empty((GRID_SIZE - 1, GRID_SIZE), dtype=np.bool_)
+
 # Global variables to store current plot state
 points = None
 colors = None
-index_grid = None
-color_grid = None
+index_grid = np.empty((GRID_SIZE, GRID_SIZE), dtype=np.uint16)
+color_grid = np.empty((GRID_SIZE, GRID_SIZE), dtype=np.uint8)
+
+# Colormaps already built, keyed by color pool
+cmap_cache = {}
+
+# GPU kernel (one thread per grid point, color lookup table in constant memory) and persistent device buffers
+if USE_GPU:
+    try:
+        voronoi_gpu_module = cupy.RawModule(code=r'''
+        __constant__ unsigned char color_lut[MAX_POINTS];
+
+        extern "C" __global__
+        void assign_voronoi(const float* px, const float* py, const int num_points,
+                            const float* gx, const float* gy, const int grid_size,
+                            unsigned short* index_grid, unsigned char* color_grid) {
+            int tid = blockDim.x * blockIdx.x + threadIdx.x;
+            if (tid >= grid_size * grid_size) return;
+            float x = gx[tid % grid_size];
+            float y = gy[tid / grid_size];
+            float best_dist = 3.402823e38f;
+            int best = 0;
+            for (int k = 0; k < num_points; k++) {
+                float dx = x - px[k];
+                float dy = y - py[k];
+                float dist = dx * dx + dy * dy;
+                if (dist < best_dist) {
+                    best_dist = dist;
+                    best = k;
+                }
+            }
+            index_grid[tid] = best;
+            color_grid[tid] = color_lut[best];
+        }
+        ''', options=('-DMAX_POINTS=%d' % MAX_POINTS,))
+        voronoi_gpu_kernel = voronoi_gpu_module.get_function('assign_voronoi')
+        gpu_color_lut = cupy.ndarray((MAX_POINTS,), dtype=cupy.uint8, memptr=voronoi_gpu_module.get_global('color_lut'))
+        gpu_grid_x = cupy.asarray(grid_x)
+        gpu_grid_y = cupy.asarray(grid_y)
+        gpu_index_grid = cupy.empty((GRID_SIZE, GRID_SIZE), dtype=cupy.uint16)
+        gpu_color_grid = cupy.empty((GRID_SIZE, GRID_SIZE), dtype=cupy.uint8)
+    except Exception:
+        USE_GPU = False
 
 # Function to calculate axes width in normalized coordinates for fixed pixel width
 def get_fixed_width_axes(fig, pixel_width=222):
@@ -43,130 +117,155 @@ def get_right_aligned_x(fig, pixel_width=222, pixel_margin=70):
     margin = pixel_margin / fig_width_pixels
     return 1 - ui_width - margin  # Align to right border with 70-pixel margin
 
-# Function to generate a random color distinct from existing colors
-def generate_unique_color(existing_colors):
-    threshold = 0.1  # Minimum distance in normalized RGB space
-    max_attempts = 100  # Prevent infinite loops
-
-    for _ in range(max_attempts):
-        rgb = np.random.rand(3)  # Random RGB values [0, 1]
-        hex_color = '#{:02x}{:02x}{:02x}'.format(
-            int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255)
-        )
-        # Check if color is distinct from existing colors
-        too_close = False
-        for existing in existing_colors:
-            existing_rgb = np.array(mcolors.to_rgb(existing))
-            dist = np.sqrt(np.sum((rgb - existing_rgb) ** 2))
-            if dist < threshold:
-                too_close = True
-                break
-        if not too_close:
-            return hex_color
-    # Fallback: return a distinct gray
-    return '#808080'
+# Function to generate the color pool: black and white, then evenly spaced hues (golden ratio steps)
+def generate_color_pool(num_colors):
+    golden_ratio_conjugate = 0.6180339887
+    hues = (0.5 + np.arange(num_colors - 2) * golden_ratio_conjugate) % 1.0
+    hsv = np.column_stack([hues, np.full_like(hues, 0.65), np.full_like(hues, 0.9)])
+    return ['#000000', '#FFFFFF'] + [mcolors.to_hex(rgb) for rgb in mcolors.hsv_to_rgb(hsv)]
+
+# Function to compute closest point indices, colors and boundary masks in one pass (parallel over tiles of grid rows)
+# Each tile also computes the first row of the next tile (one-row halo), so boundaries between tiles need no second pass
+@njit(parallel=True, fastmath=True, cache=True)
+def assign_voronoi_tiles(px, py, gx, gy, color_lut, index_grid, color_grid, h_mask, v_mask, tile_rows):
+    n_rows = gy.shape[0]
+    n_cols = gx.shape[0]
+    for t in prange((n_rows + tile_rows - 1) // tile_rows):
+        i0 = t * tile_rows
+        i1 = min(i0 + tile_rows, n_rows)
+        halo_i1 = min(i1 + 1, n_rows)
+
+        # Closest point per tile cell, keeping a running minimum per row so the inner loop vectorizes (SIMD)
+        tile_idx = np.zeros((halo_i1 - i0, n_cols), dtype=np.uint16)
+        best_dist = np.empty(n_cols, dtype=np.float32)
+        for ti in range(halo_i1 - i0):
+            best_dist[:] = np.finfo(np.float32).max  # Finite sentinel (fastmath assumes no inf)
+            row_idx = tile_idx[ti]
+            for k in range(px.shape[0]):
+                dy = gy[i0 + ti] - py[k]
+                dy2 = dy * dy
+                for j in range(n_cols):
+                    dx = gx[j] - px[k]
+                    dist = dx * dx + dy2
+                    if dist < best_dist[j]:
+                        best_dist[j] = dist
+                        row_idx[j] = k
+
+        # Write indices and colors, and compare with right/upper neighbors for boundaries
+        for i in range(i0, i1):
+            ti = i - i0
+            for j in range(n_cols):
+                idx = tile_idx[ti, j]
+                index_grid[i, j] = idx
+                color_grid[i, j] = color_lut[idx]
+                if j + 1 < n_cols:
+                    h_mask[i, j] = idx != tile_idx[ti, j + 1]
+                if i + 1 < n_rows:
+                    v_mask[i, j] = idx != tile_idx[ti + 1, j]
+
+# Function to compute closest point indices, colors and boundary masks on the GPU (results copied to host buffers)
+def assign_voronoi_gpu(points, color_lut):
+    px = cupy.asarray(np.ascontiguousarray(points[:, 0]))
+    py = cupy.asarray(np.ascontiguousarray(points[:, 1]))
+    threads = 256
+    blocks = (GRID_SIZE * GRID_SIZE + threads - 1) // threads
+    gpu_color_lut[:len(color_lut)].set(color_lut)
+    voronoi_gpu_kernel((blocks,), (threads,), (px, py, np.int32(len(points)), gpu_grid_x, gpu_grid_y, np.int32(GRID_SIZE),
+                                               gpu_index_grid, gpu_color_grid))
+    gpu_index_grid.get(out=index_grid)
+    gpu_color_grid.get(out=color_grid)
+    (gpu_index_grid[:, :-1] != gpu_index_grid[:, 1:]).get(out=h_mask)
+    (gpu_index_grid[:-1, :] != gpu_index_grid[1:, :]).get(out=v_mask)
 
 # Function to generate and plot Voronoi diagram
-def generate_voronoi(ax, point_plots, boundary_lines, check_points, check_boundaries, num_points, num_colors):
-    global points, colors, index_grid, color_grid
-
-    # Clear previous points and boundary lines
-    for plot in point_plots:
-        plot.remove()
-    point_plots.clear()
-    for line in boundary_lines:
-        line.remove()
-    boundary_lines.clear()
+def generate_voronoi(ax, check_points, check_boundaries, num_points, num_colors):
+    global points, colors
 
     # Generate random points in a 10x10 area
+    num_points = int(num_points)
     np.random.seed()  # Remove seed for true randomness
-    points = np.random.rand(int(num_points), 2) * 10
+    points = points_buffer[:num_points]
+    points[:] = np.random.rand(num_points, 2) * 10
 
     # Cap num_colors at num_points to avoid unused colors
-    num_points = int(num_points)
     num_colors = min(int(num_colors), num_points)
 
-    # Generate color pool: black and white first, then unique random colors
-    color_pool = ['#000000', '#FFFFFF']  # Black and white always included
-    for _ in range(num_colors - 2):  # Add unique random colors if num_colors > 2
-        color_pool.append(generate_unique_color(color_pool))
+    # Generate color pool: black and white first, then distinct colors
+    color_pool = generate_color_pool(num_colors)
     
-    # Assign colors evenly to points with random remainder distribution
+    # Assign color indices evenly to points with random remainder distribution
     colors_per_point = num_points // num_colors  # Base number of points per color
     remainder = num_points % num_colors  # Extra points to distribute
-    colors = []
-    # Add base number of points for each color
-    for i in range(num_colors):
-        colors.extend([color_pool[i]] * colors_per_point)
+    colors_arr = np.repeat(np.arange(num_colors, dtype=np.uint8), colors_per_point)
     # Randomly assign remainder points to colors
     if remainder > 0:
-        extra_colors = random.sample(range(num_colors), remainder)  # Randomly select colors for extra points
-        for i in extra_colors:
-            colors.append(color_pool[i])
-    random.shuffle(colors)  # Randomize order while keeping distribution
+        extra_colors = np.random.choice(num_colors, remainder, replace=False).astype(np.uint8)  # Randomly select colors for extra points
+        colors_arr = np.concatenate([colors_arr, extra_colors])
+    np.random.shuffle(colors_arr)  # Randomize order while keeping distribution
+
+    # Hex color of each point, used for drawing the points
+    colors = [color_pool[i] for i in colors_arr]
 
     # Debug: Verify color assignments
-    print(f"Num colors: {num_colors}, Color pool: {color_pool[:num_colors]}")
-    print(f"Point colors: {[(i, c) for i, c in enumerate(colors)]}")
-    print(f"Color counts: {[(c, colors.count(c)) for c in set(colors)]}")
-
-    # Create a mapping from colors to their indices in color_pool
-    color_to_index = {color: i for i, color in enumerate(color_pool[:num_colors])}
-    print(f"Color to index: {color_to_index}")
-
-    # Create a grid for computing Voronoi diagram
-    grid_size = 300  # Optimized for performance
-    x = np.linspace(0, 10, grid_size)
-    y = np.linspace(0, 10, grid_size)
-    X, Y = np.meshgrid(x, y)
-    grid_points = np.vstack([X.ravel(), Y.ravel()]).T
-
-    # Compute the nearest point index and color for each grid point
-    color_grid = np.zeros((grid_size, grid_size), dtype=int)
-    index_grid = np.zeros((grid_size, grid_size), dtype=int)
-    for i, grid_point in enumerate(grid_points):
-        distances = np.sum((points - grid_point) ** 2, axis=1)
-        closest_point_idx = np.argmin(distances)
-        index_grid[i // grid_size, i % grid_size] = closest_point_idx
-        color_grid[i // grid_size, i % grid_size] = color_to_index[colors[closest_point_idx]]
+    if DEBUG:
+        print(f"Num colors: {num_colors}, Color pool: {color_pool[:num_colors]}")
+        print(f"Point colors: {[(i, c) for i, c in enumerate(colors)]}")
+        print(f"Color counts: {list(Counter(colors).items())}")
+
+    # Compute the nearest point index, color and boundary masks for each grid point in one pass
+    if USE_GPU:
+        assign_voronoi_gpu(points, colors_arr)
+    else:
+        assign_voronoi_tiles(points[:, 0], points[:, 1], grid_x, grid_y, colors_arr, index_grid, color_grid, h_mask, v_mask, TILE_ROWS)
 
     # Debug: Verify color_grid values
-    print(f"Sample color_grid values: {color_grid[:5, :5]}")
+    if DEBUG:
+        print(f"Sample color_grid values: {color_grid[:5, :5]}")
+
+    # Get colormap for the color pool, building it only once per pool
+    pool_key = tuple(color_pool[:num_colors])
+    cmap = cmap_cache.get(pool_key)
+    if cmap is None:
+        cmap = cmap_cache[pool_key] = mcolors.ListedColormap(color_pool[:num_colors])
 
-    # Update Voronoi plot with explicit colormap bounds
+    # Update Voronoi plot with explicit colormap bounds (colormap and bounds only when they changed)
     if hasattr(ax, 'voronoi_plot'):
         ax.voronoi_plot.set_data(color_grid)
-        ax.voronoi_plot.set_cmap(mcolors.ListedColormap(color_pool[:num_colors]))
-        ax.voronoi_plot.set_clim(vmin=0, vmax=num_colors-1)
+        if ax.voronoi_plot.get_cmap() is not cmap:
+            ax.voronoi_plot.set_cmap(cmap)
+        if ax.voronoi_plot.get_clim() != (0, num_colors-1):
+            ax.voronoi_plot.set_clim(vmin=0, vmax=num_colors-1)
     else:
-        cmap = mcolors.ListedColormap(color_pool[:num_colors])
         ax.voronoi_plot = ax.imshow(color_grid, extent=(0, 10, 0, 10), origin='lower', cmap=cmap, interpolation='nearest', rasterized=True, vmin=0, vmax=num_colors-1)
 
     # Plot points (visibility controlled by Show Points checkbox)
-    for i, point in enumerate(points):
-        point_plot, = ax.plot(point[0], point[1], 'o', color=colors[i], markersize=8, markeredgecolor='red', markeredgewidth=2)
-        point_plot.set_visible(check_points.get_status()[0])
-        point_plots.append(point_plot)
-
-    # Pre-calculate boundaries
-    dx = 10 / grid_size
-    dy = 10 / grid_size
-    for i in range(grid_size - 1):
-        for j in range(grid_size - 1):
-            # Check horizontal boundaries (different closest points)
-            if index_grid[i, j] != index_grid[i, j + 1]:
-                x1, y1 = j * dx, i * dy
-                x2, y2 = (j + 1) * dx, i * dy
-                line, = ax.plot([x1, x2], [y1, y2], color='grey', linewidth=1)
-                line.set_visible(check_boundaries.get_status()[0])
-                boundary_lines.append(line)
-            # Check vertical boundaries (different closest points)
-            if index_grid[i, j] != index_grid[i + 1, j]:
-                x1, y1 = j * dx, i * dy
-                x2, y2 = j * dx, (i + 1) * dy
-                line, = ax.plot([x1, x2], [y1, y2], color='grey', linewidth=1)
-                line.set_visible(check_boundaries.get_status()[0])
-                boundary_lines.append(line)
+    if hasattr(ax, 'point_scatter'):
+        ax.point_scatter.set_offsets(points)
+        ax.point_scatter.set_facecolors(colors)
+    else:
+        ax.point_scatter = ax.scatter(points[:, 0], points[:, 1], c=colors, s=64, edgecolors='red', linewidths=2)
+        ax.point_scatter.set_visible(check_points.get_status()[0])
+
+    # Pre-calculate boundaries where neighboring grid points have different closest points
+    dx = 10 / GRID_SIZE
+    dy = 10 / GRID_SIZE
+    # Like the original per-cell scan, skip the last grid row and column
+    h_cells = np.argwhere(h_mask[:-1, :])
+    v_cells = np.argwhere(v_mask[:, :-1])
+    segments = np.empty((len(h_cells) + len(v_cells), 2, 2), dtype=np.float32)
+    # Horizontal boundaries: (j, i) -> (j + 1, i)
+    h_segments = segments[:len(h_cells)]
+    h_segments[:, :, 0] = (h_cells[:, 1:2] + np.array([0, 1])) * dx
+    h_segments[:, :, 1] = h_cells[:, 0:1] * dy
+    # Vertical boundaries: (j, i) -> (j, i + 1)
+    v_segments = segments[len(h_cells):]
+    v_segments[:, :, 0] = v_cells[:, 1:2] * dx
+    v_segments[:, :, 1] = (v_cells[:, 0:1] + np.array([0, 1])) * dy
+    if hasattr(ax, 'boundary_lines'):
+        ax.boundary_lines.set_segments(segments)
+    else:
+        ax.boundary_lines = LineCollection(segments, colors='grey', linewidths=1, visible=check_boundaries.get_status()[0])
+        ax.add_collection(ax.boundary_lines)
 
     plt.draw()
 
@@ -199,7 +298,7 @@ button = Button(ax_button, 'Regenerate Image')
 
 # Add slider for number of points
 ax_points_slider = plt.axes([x_start, y_points_slider, ui_width, 0.075])
-points_slider = Slider(ax_points_slider, 'Num Points', 2, 100, valinit=20, valstep=1)
+points_slider = Slider(ax_points_slider, 'Num Points', 2, MAX_POINTS, valinit=20, valstep=1)
 points_slider.label.set_position((0.5, 1.0))  # Center label above slider
 points_slider.label.set_horizontalalignment('center')  # Ensure text is centered
 
@@ -209,12 +308,8 @@ colors_slider = Slider(ax_colors_slider, 'Num Colors', 2, 20, valinit=2, valstep
 colors_slider.label.set_position((0.5, 1.0))  # Center label above slider
 colors_slider.label.set_horizontalalignment('center')  # Ensure text is centered
 
-# Initialize point and boundary plots
-point_plots = []
-boundary_lines = []
-
 # Initial Voronoi generation
-generate_voronoi(ax, point_plots, boundary_lines, check_points, check_boundaries, points_slider.val, colors_slider.val)
+generate_voronoi(ax, check_points, check_boundaries, points_slider.val, colors_slider.val)
 
 # Disable grid lines
 ax.grid(False)
@@ -228,23 +323,30 @@ ax.set_title('Voronoi Diagram with Random Points')
 
 # Define functions for interactivity
 def toggle_points(label):
-    for point_plot in point_plots:
-        point_plot.set_visible(check_points.get_status()[0])
+    ax.point_scatter.set_visible(check_points.get_status()[0])
     plt.draw()
 
 check_points.on_clicked(toggle_points)
 
 def toggle_boundaries(label):
-    for line in boundary_lines:
-        line.set_visible(check_boundaries.get_status()[0])
+    ax.boundary_lines.set_visible(check_boundaries.get_status()[0])
     plt.draw()
 
 check_boundaries.on_clicked(toggle_boundaries)
 
+# Debounce regeneration: a single-shot timer (QTimer with Qt5Agg) is restarted on every request,
+# so only the last slider change or button click within 50 ms triggers a recompute
+regenerate_timer = fig.canvas.new_timer(interval=50)
+regenerate_timer.single_shot = True
+regenerate_timer.add_callback(lambda: generate_voronoi(ax, check_points, check_boundaries, points_slider.val, colors_slider.val))
+
 def regenerate(event):
-    generate_voronoi(ax, point_plots, boundary_lines, check_points, check_boundaries, points_slider.val, colors_slider.val)
+    regenerate_timer.stop()
+    regenerate_timer.start()
 
 button.on_clicked(regenerate)
+points_slider.on_changed(regenerate)
+colors_slider.on_changed(regenerate)
 
 # Handle window resize to maintain fixed UI width and right alignment
 def on_resize(event):